@@ -19,40 +19,42 @@ export function createPolyDataFromMesh(meshData, offsetX = 0, offsetZ = 0, rotat
   
   // Create VTK points with optional offsets and Z rotation
   const points = vtkPoints.newInstance();
-  const verticesFlat = vertices.flat();
-  const offsetVertices = new Float32Array(verticesFlat.length);
+  const numVertices = vertices.length;
+  const offsetVertices = new Float32Array(numVertices * 3);
   
   // Rotation angle in radians (around Z-axis, the blue axis)
   const angleRad = (rotateZ * Math.PI) / 180;
   const cosAngle = Math.cos(angleRad);
   const sinAngle = Math.sin(angleRad);
   
-  // Apply rotation around Z-axis first, then offset
-  for (let i = 0; i < verticesFlat.length; i += 3) {
-    const x = verticesFlat[i];
-    const y = verticesFlat[i + 1];
-    const z = verticesFlat[i + 2];
+  // Apply rotation around Z-axis first, then offset, writing straight into
+  // the typed array instead of flattening the vertex list first
+  for (let i = 0; i < numVertices; i++) {
+    const [x, y, z] = vertices[i];
     
     // Rotate around Z axis (affects X and Y coordinates)
     const rotatedX = x * cosAngle - y * sinAngle;
     const rotatedY = x * sinAngle + y * cosAngle;
     
     // Then apply offsets
-    offsetVertices[i] = rotatedX + offsetX;      // X coordinate
-    offsetVertices[i + 1] = rotatedY;            // Y coordinate
-    offsetVertices[i + 2] = z + offsetZ;         // Z coordinate
+    offsetVertices[i * 3] = rotatedX + offsetX;      // X coordinate
+    offsetVertices[i * 3 + 1] = rotatedY;            // Y coordinate
+    offsetVertices[i * 3 + 2] = z + offsetZ;         // Z coordinate
   }
   
   points.setData(offsetVertices);
 
   // Build cell array data: [numPoints, pointId1, pointId2, pointId3, numPoints, ...]
-  const cellData = [];
+  const cellData = new Uint32Array(triangles.length * 4);
   for (let i = 0; i < triangles.length; i++) {
-    cellData.push(3); // 3 points per triangle
-    cellData.push(...triangles[i]);
+    const triangle = triangles[i];
+    cellData[i * 4] = 3; // 3 points per triangle
+    cellData[i * 4 + 1] = triangle[0];
+    cellData[i * 4 + 2] = triangle[1];
+    cellData[i * 4 + 3] = triangle[2];
   }
   
-  const polys = vtkCellArray.newInstance({ values: new Uint32Array(cellData) });
+  const polys = vtkCellArray.newInstance({ values: cellData });
 
   const polyData = vtkPolyData.newInstance();
   polyData.setPoints(points);
@@ -62,7 +64,7 @@ export function createPolyDataFromMesh(meshData, offsetX = 0, offsetZ = 0, rotat
   if (curvature) {
     const scalars = vtkDataArray.newInstance({
       name: 'Curvature',
-      values: Float32Array.from(curvature),
+      values: curvature instanceof Float32Array ? curvature : Float32Array.from(curvature),
       numberOfComponents: 1,
     });
     polyData.getPointData().setScalars(scalars);
@@ -8,6 +8,26 @@ import { applyCurvatureColoring } from './rendering.js';
 import { updateHemisphereData } from './state.js';
 import { loadFreeSurferSurface, loadFreeSurferCurvature } from './freesurfer.js';
 
+// Curvature is shared by all geometries of a hemisphere, so keep it
+// keyed by URL and only fetch/parse it once per session
+const curvatureCache = new Map();
+
+/**
+ * Load FreeSurfer curvature file, reusing a previously loaded copy
+ * @param {string} url - URL to FreeSurfer curvature file
+ * @returns {Promise<Float32Array>} Parsed curvature data
+ */
+function loadCachedCurvature(url) {
+  if (!curvatureCache.has(url)) {
+    const promise = loadFreeSurferCurvature(url).catch(error => {
+      curvatureCache.delete(url);
+      throw error;
+    });
+    curvatureCache.set(url, promise);
+  }
+  return curvatureCache.get(url);
+}
+
 /**
  * Load hemisphere mesh data from FreeSurfer binary files and add to renderer
  * @param {string} surfaceUrl - URL to FreeSurfer surface file
@@ -21,14 +41,16 @@ import { loadFreeSurferSurface, loadFreeSurferCurvature } from './freesurfer.js'
  */
 export async function loadHemisphere(surfaceUrl, curvatureUrl, hemi, offsetX, offsetZ, rotateZ, renderer) {
   // Load FreeSurfer surface and curvature files
-  const surface = await loadFreeSurferSurface(surfaceUrl);
-  const curvature = await loadFreeSurferCurvature(curvatureUrl);
+  const [surface, curvature] = await Promise.all([
+    loadFreeSurferSurface(surfaceUrl),
+    loadCachedCurvature(curvatureUrl)
+  ]);
   
   // Combine into mesh data object
   const meshData = {
     vertices: surface.vertices,
     triangles: surface.triangles,
-    curvature: Array.from(curvature)
+    curvature
   };
   
   const polyData = createPolyDataFromMesh(meshData, offsetX, offsetZ, rotateZ);
@@ -89,6 +111,48 @@ export async function loadAtlasesConfig(url) {
   return await response.json();
 }
 
+/**
+ * Add the labels of one hemisphere annotation to a labels object
+ * @param {Object} labels - Labels object to add to
+ * @param {Object} annotation - Parsed FreeSurfer annotation data
+ * @param {string} hemi - Hemisphere identifier ('lh' or 'rh')
+ */
+function addAnnotationLabels(labels, annotation, hemi) {
+  if (!annotation.colorTable) {
+    return;
+  }
+  
+  // Group vertices by label value in a single pass over the annotation
+  const verticesByLabel = new Map();
+  for (let i = 0; i < annotation.vertexLabels.length; i++) {
+    const labelValue = annotation.vertexLabels[i];
+    let vertices = verticesByLabel.get(labelValue);
+    if (!vertices) {
+      vertices = [];
+      verticesByLabel.set(labelValue, vertices);
+    }
+    vertices.push(annotation.vertexIndices[i]);
+  }
+  
+  for (const entry of annotation.colorTable.entries) {
+    if (entry.name === 'unknown' || entry.name === 'corpuscallosum' || entry.name === 'Unknown' || entry.name === 'Medial_wall') {
+      continue; // Skip unknown, corpus callosum, and medial wall
+    }
+    
+    const vertices = verticesByLabel.get(entry.label);
+    
+    if (vertices && vertices.length > 0) {
+      // Add hemisphere suffix since annotation names don't include it
+      const labelName = `${entry.name}-${hemi}`;
+      labels[labelName] = {
+        hemi,
+        vertices: vertices,
+        color: [entry.r, entry.g, entry.b]
+      };
+    }
+  }
+}
+
 /**
  * Load FreeSurfer annotation file and convert to labels format
  * @param {string} lhAnnotUrl - URL to left hemisphere annotation file
@@ -99,70 +163,17 @@ export async function loadAnnotationLabels(lhAnnotUrl, rhAnnotUrl) {
   const { parseFreeSurferAnnotation } = await import('./freesurfer.js');
   
   // Load both hemisphere annotations
-  const lhResponse = await fetch(lhAnnotUrl);
-  const lhBuffer = await lhResponse.arrayBuffer();
+  const [lhBuffer, rhBuffer] = await Promise.all([
+    fetch(lhAnnotUrl).then(response => response.arrayBuffer()),
+    fetch(rhAnnotUrl).then(response => response.arrayBuffer())
+  ]);
   const lhAnnotation = parseFreeSurferAnnotation(lhBuffer);
-  
-  const rhResponse = await fetch(rhAnnotUrl);
-  const rhBuffer = await rhResponse.arrayBuffer();
   const rhAnnotation = parseFreeSurferAnnotation(rhBuffer);
   
   // Convert to labels format
   const labels = {};
-  
-  // Process left hemisphere
-  if (lhAnnotation.colorTable) {
-    for (const entry of lhAnnotation.colorTable.entries) {
-      if (entry.name === 'unknown' || entry.name === 'corpuscallosum' || entry.name === 'Unknown' || entry.name === 'Medial_wall') {
-        continue; // Skip unknown, corpus callosum, and medial wall
-      }
-      
-      // Find all vertices with this label
-      const vertices = [];
-      for (let i = 0; i < lhAnnotation.vertexLabels.length; i++) {
-        if (lhAnnotation.vertexLabels[i] === entry.label) {
-          vertices.push(lhAnnotation.vertexIndices[i]);
-        }
-      }
-      
-      if (vertices.length > 0) {
-        // Add hemisphere suffix since annotation names don't include it
-        const labelName = `${entry.name}-lh`;
-        labels[labelName] = {
-          hemi: 'lh',
-          vertices: vertices,
-          color: [entry.r, entry.g, entry.b]
-        };
-      }
-    }
-  }
-  
-  // Process right hemisphere
-  if (rhAnnotation.colorTable) {
-    for (const entry of rhAnnotation.colorTable.entries) {
-      if (entry.name === 'unknown' || entry.name === 'corpuscallosum' || entry.name === 'Unknown' || entry.name === 'Medial_wall') {
-        continue; // Skip unknown, corpus callosum, and medial wall
-      }
-      
-      // Find all vertices with this label
-      const vertices = [];
-      for (let i = 0; i < rhAnnotation.vertexLabels.length; i++) {
-        if (rhAnnotation.vertexLabels[i] === entry.label) {
-          vertices.push(rhAnnotation.vertexIndices[i]);
-        }
-      }
-      
-      if (vertices.length > 0) {
-        // Add hemisphere suffix since annotation names don't include it
-        const labelName = `${entry.name}-rh`;
-        labels[labelName] = {
-          hemi: 'rh',
-          vertices: vertices,
-          color: [entry.r, entry.g, entry.b]
-        };
-      }
-    }
-  }
+  addAnnotationLabels(labels, lhAnnotation, 'lh');
+  addAnnotationLabels(labels, rhAnnotation, 'rh');
   
   return labels;
 }
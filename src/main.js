@@ -83,28 +83,29 @@ async function loadBrainGeometry(geometry) {
   
   const fsGeometry = geometryFileMap[geometry] || geometry;
   
-  // Load both hemispheres with FreeSurfer binary files
+  // Load both hemispheres with FreeSurfer binary files (in parallel)
   const lhConfig = getHemisphereConfig('lh');
-  await loadHemisphere(
-    `${BASE_PATH}/data/fsaverage/surf/lh.${fsGeometry}`,
-    `${BASE_PATH}/data/fsaverage/surf/lh.curv`,
-    'lh', 
-    lhConfig.offsetX,
-    lhConfig.offsetZ,
-    lhConfig.rotateZ, 
-    renderer
-  );
-  
   const rhConfig = getHemisphereConfig('rh');
-  await loadHemisphere(
-    `${BASE_PATH}/data/fsaverage/surf/rh.${fsGeometry}`,
-    `${BASE_PATH}/data/fsaverage/surf/rh.curv`,
-    'rh', 
-    rhConfig.offsetX,
-    rhConfig.offsetZ,
-    rhConfig.rotateZ,
-    renderer
-  );
+  await Promise.all([
+    loadHemisphere(
+      `${BASE_PATH}/data/fsaverage/surf/lh.${fsGeometry}`,
+      `${BASE_PATH}/data/fsaverage/surf/lh.curv`,
+      'lh', 
+      lhConfig.offsetX,
+      lhConfig.offsetZ,
+      lhConfig.rotateZ, 
+      renderer
+    ),
+    loadHemisphere(
+      `${BASE_PATH}/data/fsaverage/surf/rh.${fsGeometry}`,
+      `${BASE_PATH}/data/fsaverage/surf/rh.curv`,
+      'rh', 
+      rhConfig.offsetX,
+      rhConfig.offsetZ,
+      rhConfig.rotateZ,
+      renderer
+    )
+  ]);
   
   console.log(`${geometry} surfaces loaded successfully`);
 }
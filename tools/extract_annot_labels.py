@@ -6,64 +6,75 @@ import sys
 import struct
 from pathlib import Path
 
+# Big-endian int32, the scalar type used throughout the annotation format
+INT32 = struct.Struct('>i')
+
+# Color table entry header: structure index + name length
+ENTRY_HEADER = struct.Struct('>ii')
+
+# Size of the RGBA block (4 x int32) following each entry name
+RGBA_SIZE = 16
+
 def read_annot(filepath):
     """Read FreeSurfer annotation file and return label names"""
     with open(filepath, 'rb') as f:
         # Read number of vertices
-        num_vertices = struct.unpack('>i', f.read(4))[0]
+        num_vertices = INT32.unpack(f.read(4))[0]
         
-        # Skip vertex data (each vertex has index + label = 8 bytes)
+        # Skip vertex data (each vertex has index + label = 8 bytes) and read
+        # the remaining color table into a single buffer
         f.seek(num_vertices * 8, 1)
-        
-        # Check for color table
-        has_colortable = struct.unpack('>i', f.read(4))[0]
-        
-        if has_colortable != 1:
-            return []
-        
-        # Read version/numEntries
-        version_or_entries = struct.unpack('>i', f.read(4))[0]
-        is_version2 = version_or_entries < 0
-        
-        if is_version2:
-            # Skip max_structure_index
-            f.read(4)
-        
-        # Read filename length and skip filename
-        filename_len = struct.unpack('>i', f.read(4))[0]
-        f.read(filename_len)
-        
-        # Read number of entries
-        num_entries = struct.unpack('>i', f.read(4))[0]
-        
-        labels = []
-        
-        # Read each entry
-        for i in range(num_entries):
-            try:
-                # Structure index
-                structure = struct.unpack('>i', f.read(4))[0]
-                
-                # Name length
-                name_len = struct.unpack('>i', f.read(4))[0]
-                
-                # Name
-                name_bytes = f.read(name_len)
-                name = name_bytes.decode('utf-8', errors='ignore').rstrip('\x00')
-                
-                # RGBA
-                rgba_data = f.read(16)
-                if len(rgba_data) < 16:
-                    print(f"Warning: incomplete RGBA data for entry {i}, skipping")
-                    break
-                r, g, b, a = struct.unpack('>iiii', rgba_data)
-                
-                labels.append(name)
-            except Exception as e:
-                print(f"Error reading entry {i}: {e}")
+        data = f.read()
+    
+    # Check for color table
+    has_colortable = INT32.unpack_from(data, 0)[0]
+    offset = 4
+    
+    if has_colortable != 1:
+        return []
+    
+    # Read version/numEntries
+    version_or_entries = INT32.unpack_from(data, offset)[0]
+    offset += 4
+    is_version2 = version_or_entries < 0
+    
+    if is_version2:
+        # Skip max_structure_index
+        offset += 4
+    
+    # Read filename length and skip filename
+    filename_len = INT32.unpack_from(data, offset)[0]
+    offset += 4 + filename_len
+    
+    # Read number of entries
+    num_entries = INT32.unpack_from(data, offset)[0]
+    offset += 4
+    
+    labels = []
+    
+    # Read each entry
+    for i in range(num_entries):
+        try:
+            # Structure index and name length
+            structure, name_len = ENTRY_HEADER.unpack_from(data, offset)
+            offset += ENTRY_HEADER.size
+            
+            # Name
+            name = data[offset:offset + name_len].decode('utf-8', errors='ignore').rstrip('\x00')
+            offset += name_len
+            
+            # Skip RGBA, only the names are needed
+            if offset + RGBA_SIZE > len(data):
+                print(f"Warning: incomplete RGBA data for entry {i}, skipping")
                 break
-        
-        return labels
+            offset += RGBA_SIZE
+            
+            labels.append(name)
+        except Exception as e:
+            print(f"Error reading entry {i}: {e}")
+            break
+    
+    return labels
 
 if __name__ == '__main__':
     if len(sys.argv) < 2: